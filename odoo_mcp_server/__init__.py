@@ -7,6 +7,6 @@ __author__ = "Developer"
 __email__ = "dev@example.com"
 
 from .main import OdooMCPServer
-from .odoo_client import OdooClient
+from .odoo_client import OdooClient, OdooClientPool
 
-__all__ = ["OdooMCPServer", "OdooClient"]
\ No newline at end of file
+__all__ = ["OdooMCPServer", "OdooClient", "OdooClientPool"]
\ No newline at end of file
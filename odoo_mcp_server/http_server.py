@@ -5,39 +5,150 @@ Provides REST endpoints for Odoo operations instead of stdio communication
 """
 import os
 import asyncio
+import hashlib
+import inspect
 import logging
+import time
+from functools import wraps
 from typing import Any, Dict, List, Optional
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
+import orjson
 import uvicorn
-from .odoo_client import OdooClient
+from .odoo_client import OdooClientPool
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Configuration surface, resolved once at import (after load_dotenv)
+_DEFAULT_URL = os.getenv("ODOO_URL")
+_DEFAULT_DATABASE = os.getenv("ODOO_DATABASE")
+_DEFAULT_USERNAME = os.getenv("ODOO_USERNAME")
+_DEFAULT_PASSWORD = os.getenv("ODOO_PASSWORD")
+_PORT = int(os.getenv("PORT", "8000"))
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Odoo MCP HTTP API Server", version="0.2.0")
+# Machine-to-machine deployments don't need interactive docs; disabling
+# them also skips OpenAPI schema generation entirely
+_IS_PROD = os.getenv("ENV") == "prod"
+
+# orjson serializes large record lists several times faster than the
+# stdlib json encoder, which matters most for /search and /models payloads
+app = FastAPI(
+    title="Odoo MCP HTTP API Server",
+    version="0.2.0",
+    default_response_class=ORJSONResponse,
+    docs_url=None if _IS_PROD else "/docs",
+    redoc_url=None if _IS_PROD else "/redoc",
+    openapi_url=None if _IS_PROD else "/openapi.json",
+)
+
+class HealthFastPath:
+    """Answer GET /health before the middleware and routing stack runs
+
+    Load balancers and k8s hit /health at high frequency; serving it as
+    a raw ASGI response skips FastAPI routing, response modeling and
+    every other middleware for the hottest endpoint on the service.
+    """
+
+    def __init__(self, app, state):
+        self.app = app
+        self.state = state
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == "/health" and scope["method"] == "GET":
+            connected = b"true" if self.state.pool is not None else b"false"
+            body = b'{"status":"healthy","connected":' + connected + b"}"
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+        await self.app(scope, receive, send)
+
+# Serialized OpenAPI schema and its content hash, filled in at startup
+_openapi_bytes: Optional[bytes] = None
+_openapi_etag: Optional[str] = None
+
+@app.on_event("startup")
+async def warm_openapi():
+    """Generate and serialize the OpenAPI schema at startup
+
+    FastAPI builds openapi.json lazily, so without this the first real
+    request after boot pays the schema-generation latency. The bytes and
+    their ETag are cached so schema polls can be answered with a 304.
+    """
+    global _openapi_bytes, _openapi_etag
+    if not _IS_PROD:
+        _openapi_bytes = orjson.dumps(app.openapi())
+        _openapi_etag = hashlib.md5(_openapi_bytes).hexdigest()
+
+@app.middleware("http")
+async def openapi_etag(request: Request, call_next):
+    """Serve the cached schema bytes and honor If-None-Match
+
+    MCP tooling re-polls the OpenAPI schema frequently; conditional GETs
+    let the client skip the body transfer entirely.
+    """
+    if request.url.path == "/openapi.json" and _openapi_etag is not None:
+        if request.headers.get("if-none-match") == _openapi_etag:
+            return Response(status_code=304, headers={"ETag": _openapi_etag})
+        return Response(
+            content=_openapi_bytes,
+            media_type="application/json",
+            headers={"ETag": _openapi_etag}
+        )
+    return await call_next(request)
+
+# Middleware registration order matters: add_middleware prepends, so the
+# ETag responder above sits innermost, GZip wraps it (compressing the
+# cold schema path along with the JSON endpoints), and the health fast
+# path added last stays outermost, ahead of everything.
+#
+# Odoo model/field dumps are highly redundant JSON and compress 5-10x;
+# level 1 keeps the CPU cost negligible and minimum_size leaves small
+# responses (/health, /, /create) untouched
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+
+# Per-process connection state lives on app.state so each Gunicorn
+# worker maintains its own pool of authenticated XML-RPC sessions
+app.state.pool = None
+app.state.connection_params = None
+
+# Registered last so it sits outermost, ahead of GZip and the router
+app.add_middleware(HealthFastPath, state=app.state)
 
-# Global Odoo client instance
-odoo_client: Optional[OdooClient] = None
-connection_params: Optional[Dict[str, str]] = None
+_ENDPOINTS = [
+    "/connect",
+    "/search",
+    "/create",
+    "/write",
+    "/unlink",
+    "/call",
+    "/models",
+    "/fields",
+    "/count",
+    "/batch"
+]
 
 # Pydantic models for request/response validation
+# Connection fields are optional so omitted values fall back to the
+# server's ODOO_* environment defaults in the handler
 class ConnectionRequest(BaseModel):
-    url: str = Field(..., description="Odoo server URL")
-    database: str = Field(..., description="Database name")
-    username: str = Field(..., description="Username")
-    password: str = Field(..., description="Password")
-
-class SearchRequest(BaseModel):
-    model: str = Field(..., description="Odoo model name")
-    domain: List[List[Any]] = Field(default=[], description="Search domain")
-    fields: List[str] = Field(default=[], description="Fields to retrieve")
-    limit: int = Field(default=100, description="Maximum records")
+    url: Optional[str] = Field(default=None, description="Odoo server URL")
+    database: Optional[str] = Field(default=None, description="Database name")
+    username: Optional[str] = Field(default=None, description="Username")
+    password: Optional[str] = Field(default=None, description="Password")
 
 class CreateRequest(BaseModel):
     model: str = Field(..., description="Odoo model name")
@@ -52,12 +163,6 @@ class UnlinkRequest(BaseModel):
     model: str = Field(..., description="Odoo model name")
     ids: List[int] = Field(..., description="Record IDs to delete")
 
-class CallMethodRequest(BaseModel):
-    model: str = Field(..., description="Odoo model name")
-    method: str = Field(..., description="Method name")
-    args: List[Any] = Field(default=[], description="Method arguments")
-    kwargs: Dict[str, Any] = Field(default={}, description="Method keyword arguments")
-
 class GetModelsRequest(BaseModel):
     filter: Optional[str] = Field(default=None, description="Filter models by name pattern")
 
@@ -68,11 +173,91 @@ class CountRequest(BaseModel):
     model: str = Field(..., description="Odoo model name")
     domain: List[List[Any]] = Field(default=[], description="Search domain")
 
+class BatchRequest(BaseModel):
+    ops: List[Dict[str, Any]] = Field(..., description="Operations to execute, each {'op': name, 'args': {...}}")
+
+class _ResponseCache:
+    """Tiny per-process TTL cache for POST endpoint responses
+
+    fastapi-cache2 only caches GET requests, so the metadata endpoints
+    store their response dicts here instead, keyed by the connected
+    database and the request body. Expired entries are dropped on read
+    and swept on put; the entry count is capped because /count keys on
+    near-unique agent-generated domains, which would otherwise grow the
+    dict for the life of the process.
+    """
+
+    _MAX_ENTRIES = 1024
+
+    def __init__(self):
+        self._entries: Dict[str, tuple] = {}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if time.monotonic() >= expires:
+            del self._entries[key]
+            return None
+        return value
+
+    def put(self, key: str, value: Dict[str, Any], ttl: float):
+        if len(self._entries) >= self._MAX_ENTRIES:
+            now = time.monotonic()
+            for stale in [k for k, (expires, _) in self._entries.items() if now >= expires]:
+                del self._entries[stale]
+            # Still full after the sweep: drop the oldest insertions
+            while len(self._entries) >= self._MAX_ENTRIES:
+                del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+_response_cache = _ResponseCache()
+
+def _cache_key(name: str, body: Any) -> str:
+    """Build cache keys namespaced by the connected database
+
+    Metadata is per-database, so two tenants must never share entries.
+    """
+    params = app.state.connection_params
+    database = params["database"] if params else "disconnected"
+    return f"{database}:{name}:{body!r}"
+
 # Helper function to check connection
-def check_connection():
-    """Check if connected to Odoo"""
-    if not odoo_client:
+def check_connection() -> OdooClientPool:
+    """Return the connected client pool or fail with a 400"""
+    pool = app.state.pool
+    if not pool:
         raise HTTPException(status_code=400, detail="Not connected to Odoo. Use /connect endpoint first.")
+    return pool
+
+def odoo_endpoint(op_name: str):
+    """Wrap an Odoo endpoint with the shared connection check and error handling
+
+    Every operation endpoint repeats the same check_connection() +
+    try/except + logger.error + HTTPException construct; this collapses
+    it into one place. The wrapped handler receives the client pool as
+    its second argument; the `pool` parameter is stripped from the
+    signature FastAPI inspects.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        async def wrapper(request):
+            pool = check_connection()
+            try:
+                return await fn(request, pool)
+            except HTTPException:
+                raise
+            except Exception as e:
+                logger.error("%s error: %s", op_name, e)
+                raise HTTPException(status_code=500, detail=f"{op_name} failed: {str(e)}")
+
+        sig = inspect.signature(fn)
+        wrapper.__signature__ = sig.replace(
+            parameters=[p for name, p in sig.parameters.items() if name != "pool"]
+        )
+        return wrapper
+    return decorator
 
 @app.get("/")
 async def root():
@@ -81,18 +266,8 @@ async def root():
         "status": "ok",
         "service": "Odoo MCP HTTP API Server",
         "version": "0.2.0",
-        "connected": odoo_client is not None,
-        "endpoints": [
-            "/connect",
-            "/search",
-            "/create",
-            "/write",
-            "/unlink",
-            "/call",
-            "/models",
-            "/fields",
-            "/count"
-        ]
+        "connected": app.state.pool is not None,
+        "endpoints": _ENDPOINTS
     }
 
 @app.get("/health")
@@ -100,20 +275,18 @@ async def health():
     """Health check for monitoring"""
     return {
         "status": "healthy",
-        "connected": odoo_client is not None
+        "connected": app.state.pool is not None
     }
 
 @app.post("/connect")
 async def connect(request: ConnectionRequest):
     """Connect to Odoo instance"""
-    global odoo_client, connection_params
-    
     try:
-        # Use provided args or fallback to environment variables
-        url = request.url or os.getenv("ODOO_URL")
-        database = request.database or os.getenv("ODOO_DATABASE")
-        username = request.username or os.getenv("ODOO_USERNAME")
-        password = request.password or os.getenv("ODOO_PASSWORD")
+        # Use provided args or fallback to environment defaults
+        url = request.url or _DEFAULT_URL
+        database = request.database or _DEFAULT_DATABASE
+        username = request.username or _DEFAULT_USERNAME
+        password = request.password or _DEFAULT_PASSWORD
         
         if not all([url, database, username, password]):
             raise HTTPException(
@@ -121,16 +294,23 @@ async def connect(request: ConnectionRequest):
                 detail="Missing connection parameters. Provide url, database, username, password or set environment variables."
             )
         
-        odoo_client = OdooClient(
+        pool = OdooClientPool(
             url=url,
             database=database,
             username=username,
-            password=password
+            password=password,
+            size=int(os.getenv("ODOO_POOL_SIZE", "8"))
         )
-        await odoo_client.connect()
-        
+        await pool.connect()
+        # Swap in the new pool before closing the old one so there is
+        # no window where requests see no pool; the superseded pool's
+        # clients are closed to release their executors and sockets
+        old_pool, app.state.pool = app.state.pool, pool
+        if old_pool is not None:
+            await old_pool.close()
+
         # Store connection params for reconnection
-        connection_params = {
+        app.state.connection_params = {
             "url": url,
             "database": database,
             "username": username,
@@ -142,165 +322,249 @@ async def connect(request: ConnectionRequest):
             "message": f"Successfully connected to Odoo at {url} (database: {database})"
         }
     except Exception as e:
-        logger.error(f"Connection error: {str(e)}")
+        logger.error("Connection error: %s", e)
         raise HTTPException(status_code=500, detail=f"Connection failed: {str(e)}")
 
 @app.post("/search")
-async def search(request: SearchRequest):
-    """Search records in Odoo model"""
-    check_connection()
-    
-    try:
-        result = await odoo_client.search_read(
-            model=request.model,
-            domain=request.domain,
-            fields=request.fields,
-            limit=request.limit
+@odoo_endpoint("Search")
+async def search(request: Request, pool: OdooClientPool):
+    """Search records in Odoo model
+
+    The body is forwarded to Odoo as-is, so it is read directly instead
+    of paying Pydantic model construction on every request.
+    """
+    body = await request.json()
+    if "model" not in body:
+        raise HTTPException(status_code=400, detail="Missing required field: model")
+
+    async with pool.acquire() as client:
+        result = await client.search_read(
+            model=body["model"],
+            domain=body.get("domain", []),
+            fields=body.get("fields", []),
+            limit=body.get("limit", 100)
         )
+
+    # Small results aren't worth the streaming machinery
+    if len(result) <= 10:
         return {
             "status": "success",
             "count": len(result),
             "records": result
         }
-    except Exception as e:
-        logger.error(f"Search error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
+
+    def stream():
+        """Serialize record-by-record so the first byte goes out before
+        the whole payload is encoded and peak memory stays constant"""
+        yield b'{"status":"success","count":' + str(len(result)).encode() + b',"records":['
+        first = True
+        for record in result:
+            if not first:
+                yield b","
+            first = False
+            yield orjson.dumps(record)
+        yield b"]}"
+
+    return StreamingResponse(stream(), media_type="application/json")
 
 @app.post("/create")
-async def create(request: CreateRequest):
+@odoo_endpoint("Create")
+async def create(request: CreateRequest, pool: OdooClientPool):
     """Create new record in Odoo"""
-    check_connection()
-    
-    try:
-        record_id = await odoo_client.create(
+    async with pool.acquire() as client:
+        record_id = await client.create(
             model=request.model,
             values=request.values
         )
-        return {
-            "status": "success",
-            "id": record_id,
-            "message": f"Created record with ID: {record_id}"
-        }
-    except Exception as e:
-        logger.error(f"Create error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Create failed: {str(e)}")
+    return {
+        "status": "success",
+        "id": record_id,
+        "message": f"Created record with ID: {record_id}"
+    }
 
 @app.post("/write")
-async def write(request: WriteRequest):
+@odoo_endpoint("Update")
+async def write(request: WriteRequest, pool: OdooClientPool):
     """Update existing records in Odoo"""
-    check_connection()
-    
-    try:
-        result = await odoo_client.write(
+    async with pool.acquire() as client:
+        result = await client.write(
             model=request.model,
             ids=request.ids,
             values=request.values
         )
-        return {
-            "status": "success",
-            "updated": len(request.ids),
-            "result": result,
-            "message": f"Updated {len(request.ids)} records"
-        }
-    except Exception as e:
-        logger.error(f"Write error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Update failed: {str(e)}")
+    return {
+        "status": "success",
+        "updated": len(request.ids),
+        "result": result,
+        "message": f"Updated {len(request.ids)} records"
+    }
 
 @app.post("/unlink")
-async def unlink(request: UnlinkRequest):
+@odoo_endpoint("Delete")
+async def unlink(request: UnlinkRequest, pool: OdooClientPool):
     """Delete records from Odoo"""
-    check_connection()
-    
-    try:
-        result = await odoo_client.unlink(
+    async with pool.acquire() as client:
+        result = await client.unlink(
             model=request.model,
             ids=request.ids
         )
-        return {
-            "status": "success",
-            "deleted": len(request.ids),
-            "result": result,
-            "message": f"Deleted {len(request.ids)} records"
-        }
-    except Exception as e:
-        logger.error(f"Unlink error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Delete failed: {str(e)}")
+    return {
+        "status": "success",
+        "deleted": len(request.ids),
+        "result": result,
+        "message": f"Deleted {len(request.ids)} records"
+    }
 
 @app.post("/call")
-async def call_method(request: CallMethodRequest):
-    """Call method on Odoo model"""
-    check_connection()
-    
-    try:
-        result = await odoo_client.call_method(
-            model=request.model,
-            method=request.method,
-            args=request.args,
-            kwargs=request.kwargs
+@odoo_endpoint("Method call")
+async def call_method(request: Request, pool: OdooClientPool):
+    """Call method on Odoo model
+
+    Arguments are passed through verbatim, so the body is read directly
+    rather than validated into a Pydantic model first.
+    """
+    body = await request.json()
+    if "model" not in body or "method" not in body:
+        raise HTTPException(status_code=400, detail="Missing required fields: model, method")
+
+    async with pool.acquire() as client:
+        result = await client.call_method(
+            model=body["model"],
+            method=body["method"],
+            args=body.get("args", []),
+            kwargs=body.get("kwargs", {})
         )
-        return {
-            "status": "success",
-            "result": result
-        }
-    except Exception as e:
-        logger.error(f"Call error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Method call failed: {str(e)}")
+    return {
+        "status": "success",
+        "result": result
+    }
 
 @app.post("/models")
-async def get_models(request: GetModelsRequest):
-    """Get list of available Odoo models"""
-    check_connection()
-    
-    try:
-        models = await odoo_client.get_models(request.filter)
-        return {
-            "status": "success",
-            "count": len(models),
-            "models": models
-        }
-    except Exception as e:
-        logger.error(f"Get models error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Get models failed: {str(e)}")
+@odoo_endpoint("Get models")
+async def get_models(request: GetModelsRequest, pool: OdooClientPool):
+    """Get list of available Odoo models
+
+    Model metadata only changes on module upgrades, so responses are
+    cached for an hour to skip the XML-RPC round trip.
+    """
+    key = _cache_key("models", request.filter)
+    cached = _response_cache.get(key)
+    if cached is not None:
+        return cached
+
+    async with pool.acquire() as client:
+        models = await client.get_models(request.filter)
+    response = {
+        "status": "success",
+        "count": len(models),
+        "models": models
+    }
+    _response_cache.put(key, response, 3600)
+    return response
 
 @app.post("/fields")
-async def get_fields(request: GetFieldsRequest):
-    """Get fields information for an Odoo model"""
-    check_connection()
-    
-    try:
-        fields = await odoo_client.get_fields(request.model)
-        return {
-            "status": "success",
-            "model": request.model,
-            "fields": fields
-        }
-    except Exception as e:
-        logger.error(f"Get fields error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Get fields failed: {str(e)}")
+@odoo_endpoint("Get fields")
+async def get_fields(request: GetFieldsRequest, pool: OdooClientPool):
+    """Get fields information for an Odoo model
+
+    Field definitions only change on module upgrades; cached for an hour.
+    """
+    key = _cache_key("fields", request.model)
+    cached = _response_cache.get(key)
+    if cached is not None:
+        return cached
+
+    async with pool.acquire() as client:
+        fields = await client.get_fields(request.model)
+    response = {
+        "status": "success",
+        "model": request.model,
+        "fields": fields
+    }
+    _response_cache.put(key, response, 3600)
+    return response
+
+@app.post("/batch")
+@odoo_endpoint("Batch")
+async def batch(request: BatchRequest, pool: OdooClientPool):
+    """Execute multiple Odoo operations in one round trip
+
+    Accepts a list of {"op": name, "args": {...}} entries and runs them
+    concurrently against the authenticated session, collapsing N
+    HTTP+XML-RPC round trips into one request. Failed operations are
+    reported per-entry instead of failing the whole batch.
+    """
+    async def run_op(op: Dict[str, Any]):
+        async with pool.acquire() as client:
+            # client.ops holds methods bound once at connect time
+            fn = client.ops.get(op.get("op"))
+            if fn is None:
+                raise ValueError(f"Unknown batch operation: {op.get('op')}")
+            return await fn(**op.get("args", {}))
+
+    results = await asyncio.gather(*(run_op(op) for op in request.ops), return_exceptions=True)
+    return {
+        "status": "success",
+        "results": [
+            {"error": str(r)} if isinstance(r, Exception) else r
+            for r in results
+        ]
+    }
 
 @app.post("/count")
-async def count(request: CountRequest):
-    """Count records in Odoo model"""
-    check_connection()
-    
-    try:
-        count = await odoo_client.count(
+@odoo_endpoint("Count")
+async def count(request: CountRequest, pool: OdooClientPool):
+    """Count records in Odoo model
+
+    Counts drift with data changes, so the cache TTL is kept short.
+    """
+    key = _cache_key("count", (request.model, request.domain))
+    cached = _response_cache.get(key)
+    if cached is not None:
+        return cached
+
+    async with pool.acquire() as client:
+        count = await client.count(
             model=request.model,
             domain=request.domain
         )
-        return {
-            "status": "success",
-            "model": request.model,
-            "count": count
-        }
-    except Exception as e:
-        logger.error(f"Count error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Count failed: {str(e)}")
+    response = {
+        "status": "success",
+        "model": request.model,
+        "count": count
+    }
+    _response_cache.put(key, response, 30)
+    return response
 
 def run_http_server():
     """Run the HTTP server"""
-    port = int(os.getenv("PORT", "8000"))
+    port = _PORT
     host = "0.0.0.0"
+
+    # Multi-process mode: one uvicorn worker per the usual 2N+1 rule so
+    # independent requests fan out across cores instead of serializing
+    # on a single interpreter. Each worker keeps its own Odoo session.
+    if os.getenv("USE_GUNICORN"):
+        workers = int(os.getenv("WEB_CONCURRENCY", str(2 * (os.cpu_count() or 1) + 1)))
+        logger.info(f"Starting under Gunicorn with {workers} UvicornWorker workers on {host}:{port}")
+        os.execvp("gunicorn", [
+            "gunicorn",
+            "-k", "uvicorn.workers.UvicornWorker",
+            "-w", str(workers),
+            "-b", f"{host}:{port}",
+            "odoo_mcp_server.http_server:app",
+        ])
+
+    # Use the uvloop event loop and httptools HTTP parser when available
+    # (pure I/O-bound proxy workload, so faster socket dispatch and header
+    # parsing directly reduce per-request overhead). Fall back to the
+    # stdlib loop/parser if the speedups are not installed.
+    try:
+        import uvloop  # noqa: F401
+        import httptools  # noqa: F401
+        loop_impl, http_impl = "uvloop", "httptools"
+    except ImportError:
+        loop_impl, http_impl = "auto", "auto"
     
     logger.info(f"Starting Odoo MCP HTTP API Server on {host}:{port}")
     logger.info("Available endpoints:")
@@ -313,8 +577,11 @@ def run_http_server():
     logger.info("  POST /models - List available models")
     logger.info("  POST /fields - Get model fields")
     logger.info("  POST /count - Count records")
+    logger.info("  POST /batch - Execute multiple operations in one round trip")
     
-    uvicorn.run(app, host=host, port=port)
+    # Access logging adds significant overhead on small JSON responses;
+    # the endpoint-level logger calls provide the structured events we need.
+    uvicorn.run(app, host=host, port=port, loop=loop_impl, http=http_impl, access_log=False)
 
 if __name__ == "__main__":
     run_http_server()
\ No newline at end of file
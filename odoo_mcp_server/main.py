@@ -2,32 +2,324 @@
 import os
 import sys
 import asyncio
+import concurrent.futures
+import functools
 import logging
-import json
-from typing import Any, Dict, List, Optional
+import orjson
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 from .odoo_client import OdooClient
-from dotenv import load_dotenv
-import os
 
+# tavily pulls httpx and friends into memory at import time; defer it to
+# the first web_search call so other workloads never pay that cost
+TavilyClient = None
+_tavily_import_attempted = False
+
+# Run the stdio server on uvloop when available so the stdio streams and
+# the XML-RPC executor hand-offs get the same event-loop speedup the
+# HTTP path gets under uvicorn[standard]
 try:
-    from tavily import TavilyClient
-except Exception:
-    TavilyClient = None
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
 
-load_dotenv()
+# .env parsing opens and reads a file on every start; deployments that
+# inject configuration through the environment can skip it entirely
+if os.environ.get("MCP_LOAD_DOTENV", "1") == "1":
+    from dotenv import load_dotenv
+    load_dotenv()
+
+# Default connection parameters, resolved once at import (after load_dotenv)
+_DEFAULT_URL = os.environ.get("ODOO_URL")
+_DEFAULT_DATABASE = os.environ.get("ODOO_DATABASE")
+_DEFAULT_USERNAME = os.environ.get("ODOO_USERNAME")
+_DEFAULT_PASSWORD = os.environ.get("ODOO_PASSWORD")
+_TAVILY_API_KEY = os.environ.get("TAVILY_API_KEY")
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Payloads above this size are split into multiple TextContent chunks so
+# the transport can pipeline frames instead of buffering one huge string
+_MAX_TEXT_CHUNK = 1024 * 1024
+
+# Debounce window for coalescing bursts of odoo_write calls (seconds)
+_WRITE_COALESCE_WINDOW = 0.005
+
+# Schema fragments repeated across several tools, shared by reference.
+# Consumers treat inputSchema as read-only, so sharing is safe.
+_MODEL_PROP = {"type": "string", "description": "Odoo model name"}
+_DOMAIN_PROP = {"type": "array", "description": "Search domain"}
+
+# The schemas below are static and hand-vetted, so pydantic validation on
+# each Tool is skipped where the installed mcp version allows it
+_make_tool = getattr(Tool, "model_construct", Tool)
+_make_text = getattr(TextContent, "model_construct", TextContent)
+
+# Constant error replies built once; TextContent is a pydantic model, so
+# constructing these on every error path re-ran validation for nothing.
+# The MCP transport serializes them read-only.
+_NOT_CONNECTED = [_make_text(type="text", text="Not connected to Odoo. Use odoo_connect first.")]
+_MISSING_PARAMS = [_make_text(type="text", text="Missing connection parameters. Provide url, database, username, password or set environment variables.")]
+
+# The tool list is fully static, so it is built once at import time
+# instead of reallocating every Tool object on each list_tools request
+_TOOLS = (
+    _make_tool(
+        name="odoo_connect",
+        description="Connect to Odoo instance",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "url": {"type": "string", "description": "Odoo server URL"},
+                "database": {"type": "string", "description": "Database name"},
+                "username": {"type": "string", "description": "Username"},
+                "password": {"type": "string", "description": "Password"}
+            },
+            "required": ["url", "database", "username", "password"]
+        }
+    ),
+    _make_tool(
+        name="odoo_search",
+        description="Search records in Odoo model",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "model": _MODEL_PROP,
+                "domain": _DOMAIN_PROP,
+                "fields": {"type": "array", "description": "Fields to retrieve"},
+                "limit": {"type": "integer", "description": "Maximum records"}
+            },
+            "required": ["model"]
+        }
+    ),
+    _make_tool(
+        name="odoo_create",
+        description="Create new record in Odoo",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "model": _MODEL_PROP,
+                "values": {"type": "object", "description": "Record values"}
+            },
+            "required": ["model", "values"]
+        }
+    ),
+    _make_tool(
+        name="odoo_write",
+        description="Update existing records in Odoo",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "model": _MODEL_PROP,
+                "ids": {"type": "array", "description": "Record IDs to update"},
+                "values": {"type": "object", "description": "Values to update"}
+            },
+            "required": ["model", "ids", "values"]
+        }
+    ),
+    _make_tool(
+        name="odoo_unlink",
+        description="Delete records from Odoo",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "model": _MODEL_PROP,
+                "ids": {"type": "array", "description": "Record IDs to delete"}
+            },
+            "required": ["model", "ids"]
+        }
+    ),
+    _make_tool(
+        name="odoo_call",
+        description="Call method on Odoo model",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "model": _MODEL_PROP,
+                "method": {"type": "string", "description": "Method name"},
+                "args": {"type": "array", "description": "Method arguments"},
+                "kwargs": {"type": "object", "description": "Method keyword arguments"}
+            },
+            "required": ["model", "method"]
+        }
+    ),
+    _make_tool(
+        name="odoo_get_models",
+        description="Get list of available Odoo models",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filter": {"type": "string", "description": "Filter models by name pattern"}
+            }
+        }
+    ),
+    _make_tool(
+        name="odoo_get_fields",
+        description="Get fields information for an Odoo model",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "model": _MODEL_PROP
+            },
+            "required": ["model"]
+        }
+    ),
+    _make_tool(
+        name="odoo_count",
+        description="Count records in Odoo model",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "model": _MODEL_PROP,
+                "domain": _DOMAIN_PROP
+            },
+            "required": ["model"]
+        }
+    ),
+    _make_tool(
+        name="odoo_update_lead_contact",
+        description="Update contact information of a CRM lead (crm.lead)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "lead_id": {"type": "integer", "description": "Lead ID (crm.lead)"},
+                "values": {"type": "object", "description": "Fields to update (e.g. contact_name, email_from, phone, mobile, partner_id)"}
+            },
+            "required": ["lead_id", "values"]
+        }
+    ),
+    _make_tool(
+        name="odoo_update_contact",
+        description="Update a contact (res.partner)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "partner_id": {"type": "integer", "description": "Contact ID (res.partner)"},
+                "values": {"type": "object", "description": "Fields to update (e.g. name, email, phone, mobile)"}
+            },
+            "required": ["partner_id", "values"]
+        }
+    ),
+    _make_tool(
+        name="odoo_read_group",
+        description="Aggregate records using Odoo read_group (reporting)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "model": _MODEL_PROP,
+                "domain": _DOMAIN_PROP,
+                "fields": {"type": "array", "description": "Fields and aggregates (e.g. ['expected_revenue:sum'])"},
+                "groupby": {"type": "array", "description": "Group by fields (e.g. ['stage_id'])"},
+                "limit": {"type": "integer", "description": "Max groups to return"},
+                "orderby": {"type": "string", "description": "Ordering expression"},
+                "lazy": {"type": "boolean", "description": "Use lazy grouping (default true)"}
+            },
+            "required": ["model"]
+        }
+    ),
+    _make_tool(
+        name="odoo_batch",
+        description="Run several independent Odoo tool calls concurrently",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": "Tool calls to run, each {name, arguments}",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string", "description": "Tool name"},
+                            "arguments": {"type": "object", "description": "Tool arguments"}
+                        },
+                        "required": ["name"]
+                    }
+                }
+            },
+            "required": ["calls"]
+        }
+    ),
+    _make_tool(
+        name="web_search",
+        description="Search the web using Tavily API",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Search query"},
+                "max_results": {"type": "integer", "description": "Maximum results", "default": 5},
+                "search_depth": {"type": "string", "description": "Search depth: basic|advanced", "default": "basic"}
+            },
+            "required": ["query"]
+        }
+    ),
+)
+
+# The framework wants a list back from list_tools; materialize it once so
+# each request hands back the same object instead of copying the tuple.
+# The mcp stdio writer serializes responses itself and exposes no
+# raw-bytes shortcut, so pre-building the model objects is as far
+# upstream as the serialization work can be hoisted.
+_TOOLS_LIST = list(_TOOLS)
+
+def _requires_connection(fn):
+    """Return the standard not-connected reply unless a client is attached
+
+    Every Odoo tool handler used to repeat the same attribute check and
+    error response; centralizing it here keeps one branch per call and a
+    single place to extend (e.g. automatic reconnection) later.
+    """
+    @functools.wraps(fn)
+    async def wrapper(self, args):
+        if self.odoo_client is None:
+            return _NOT_CONNECTED
+        return await fn(self, args)
+    return wrapper
+
 class OdooMCPServer:
     def __init__(self):
         self.server = Server("odoo-mcp-server")
         self.odoo_client = None
         self.connection_params = None
+        # Reused across web_search calls so the underlying HTTP session
+        # keeps its connection pool instead of re-handshaking every time
+        self._tavily_client = None
+        # Dedicated pool for outbound blocking HTTP so web searches don't
+        # contend with Odoo RPC work on the shared default executor
+        self._io_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=8, thread_name_prefix="mcp-io"
+        )
+        # Authenticated clients keyed by (url, database, username) so
+        # reconnects reuse the existing XML-RPC session instead of
+        # re-authenticating and rebuilding transports from scratch
+        self._client_cache: Dict[tuple, OdooClient] = {}
+        # Write coalescing: agent traffic tends to fire bursts of
+        # odoo_write calls; those arriving within the debounce window
+        # that target the same model and values collapse into one RPC
+        self._write_queue: Dict[str, List[tuple]] = {}
+        self._write_flush_task: Optional[asyncio.Task] = None
+        # O(1) tool dispatch with bound methods resolved once, instead of
+        # walking an if/elif chain of string comparisons per call
+        self._dispatch: Dict[str, Callable[[Dict[str, Any]], Awaitable[List[TextContent]]]] = {
+            "odoo_connect": self._handle_connect,
+            "odoo_search": self._handle_search,
+            "odoo_create": self._handle_create,
+            "odoo_write": self._handle_write,
+            "odoo_unlink": self._handle_unlink,
+            "odoo_call": self._handle_call,
+            "odoo_get_models": self._handle_get_models,
+            "odoo_get_fields": self._handle_get_fields,
+            "odoo_count": self._handle_count,
+            "odoo_update_lead_contact": self._handle_update_lead_contact,
+            "odoo_update_contact": self._handle_update_contact,
+            "odoo_read_group": self._handle_read_group,
+            "odoo_batch": self._handle_batch,
+            "web_search": self._handle_web_search,
+        }
         self.setup_handlers()
     
     def setup_handlers(self):
@@ -36,231 +328,61 @@ class OdooMCPServer:
         @self.server.list_tools()
         async def handle_list_tools() -> List[Tool]:
             """List available tools"""
-            return [
-                Tool(
-                    name="odoo_connect",
-                    description="Connect to Odoo instance",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "url": {"type": "string", "description": "Odoo server URL"},
-                            "database": {"type": "string", "description": "Database name"},
-                            "username": {"type": "string", "description": "Username"},
-                            "password": {"type": "string", "description": "Password"}
-                        },
-                        "required": ["url", "database", "username", "password"]
-                    }
-                ),
-                Tool(
-                    name="odoo_search",
-                    description="Search records in Odoo model",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "model": {"type": "string", "description": "Odoo model name"},
-                            "domain": {"type": "array", "description": "Search domain"},
-                            "fields": {"type": "array", "description": "Fields to retrieve"},
-                            "limit": {"type": "integer", "description": "Maximum records"}
-                        },
-                        "required": ["model"]
-                    }
-                ),
-                Tool(
-                    name="odoo_create",
-                    description="Create new record in Odoo",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "model": {"type": "string", "description": "Odoo model name"},
-                            "values": {"type": "object", "description": "Record values"}
-                        },
-                        "required": ["model", "values"]
-                    }
-                ),
-                Tool(
-                    name="odoo_write",
-                    description="Update existing records in Odoo",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "model": {"type": "string", "description": "Odoo model name"},
-                            "ids": {"type": "array", "description": "Record IDs to update"},
-                            "values": {"type": "object", "description": "Values to update"}
-                        },
-                        "required": ["model", "ids", "values"]
-                    }
-                ),
-                Tool(
-                    name="odoo_unlink",
-                    description="Delete records from Odoo",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "model": {"type": "string", "description": "Odoo model name"},
-                            "ids": {"type": "array", "description": "Record IDs to delete"}
-                        },
-                        "required": ["model", "ids"]
-                    }
-                ),
-                Tool(
-                    name="odoo_call",
-                    description="Call method on Odoo model",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "model": {"type": "string", "description": "Odoo model name"},
-                            "method": {"type": "string", "description": "Method name"},
-                            "args": {"type": "array", "description": "Method arguments"},
-                            "kwargs": {"type": "object", "description": "Method keyword arguments"}
-                        },
-                        "required": ["model", "method"]
-                    }
-                ),
-                Tool(
-                    name="odoo_get_models",
-                    description="Get list of available Odoo models",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "filter": {"type": "string", "description": "Filter models by name pattern"}
-                        }
-                    }
-                ),
-                Tool(
-                    name="odoo_get_fields",
-                    description="Get fields information for an Odoo model",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "model": {"type": "string", "description": "Odoo model name"}
-                        },
-                        "required": ["model"]
-                    }
-                ),
-                Tool(
-                    name="odoo_count",
-                    description="Count records in Odoo model",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "model": {"type": "string", "description": "Odoo model name"},
-                            "domain": {"type": "array", "description": "Search domain"}
-                        },
-                        "required": ["model"]
-                    }
-                )
-                ,
-                Tool(
-                    name="odoo_update_lead_contact",
-                    description="Update contact information of a CRM lead (crm.lead)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "lead_id": {"type": "integer", "description": "Lead ID (crm.lead)"},
-                            "values": {"type": "object", "description": "Fields to update (e.g. contact_name, email_from, phone, mobile, partner_id)"}
-                        },
-                        "required": ["lead_id", "values"]
-                    }
-                ),
-                Tool(
-                    name="odoo_update_contact",
-                    description="Update a contact (res.partner)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "partner_id": {"type": "integer", "description": "Contact ID (res.partner)"},
-                            "values": {"type": "object", "description": "Fields to update (e.g. name, email, phone, mobile)"}
-                        },
-                        "required": ["partner_id", "values"]
-                    }
-                ),
-                Tool(
-                    name="odoo_read_group",
-                    description="Aggregate records using Odoo read_group (reporting)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "model": {"type": "string", "description": "Odoo model name"},
-                            "domain": {"type": "array", "description": "Search domain"},
-                            "fields": {"type": "array", "description": "Fields and aggregates (e.g. ['expected_revenue:sum'])"},
-                            "groupby": {"type": "array", "description": "Group by fields (e.g. ['stage_id'])"},
-                            "limit": {"type": "integer", "description": "Max groups to return"},
-                            "orderby": {"type": "string", "description": "Ordering expression"},
-                            "lazy": {"type": "boolean", "description": "Use lazy grouping (default true)"}
-                        },
-                        "required": ["model"]
-                    }
-                ),
-                Tool(
-                    name="web_search",
-                    description="Search the web using Tavily API",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {"type": "string", "description": "Search query"},
-                            "max_results": {"type": "integer", "description": "Maximum results", "default": 5},
-                            "search_depth": {"type": "string", "description": "Search depth: basic|advanced", "default": "basic"}
-                        },
-                        "required": ["query"]
-                    }
-                )
-            ]
+            return _TOOLS_LIST
         
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+            # Dispatch keys are compile-time literals and therefore
+            # already interned; interning the transport-supplied name too
+            # lets the dict lookup short-circuit on pointer equality
+            handler = self._dispatch.get(sys.intern(name))
+            if handler is None:
+                return [TextContent(type="text", text=f"Unknown tool: {name}")]
             try:
-                if name == "odoo_connect":
-                    return await self._handle_connect(arguments)
-                elif name == "odoo_search":
-                    return await self._handle_search(arguments)
-                elif name == "odoo_create":
-                    return await self._handle_create(arguments)
-                elif name == "odoo_write":
-                    return await self._handle_write(arguments)
-                elif name == "odoo_unlink":
-                    return await self._handle_unlink(arguments)
-                elif name == "odoo_call":
-                    return await self._handle_call(arguments)
-                elif name == "odoo_get_models":
-                    return await self._handle_get_models(arguments)
-                elif name == "odoo_get_fields":
-                    return await self._handle_get_fields(arguments)
-                elif name == "odoo_count":
-                    return await self._handle_count(arguments)
-                elif name == "odoo_update_lead_contact":
-                    return await self._handle_update_lead_contact(arguments)
-                elif name == "odoo_update_contact":
-                    return await self._handle_update_contact(arguments)
-                elif name == "odoo_read_group":
-                    return await self._handle_read_group(arguments)
-                elif name == "web_search":
-                    return await self._handle_web_search(arguments)
-                else:
-                    return [TextContent(type="text", text=f"Unknown tool: {name}")]
+                return await handler(arguments)
+            except asyncio.CancelledError:
+                # Never swallow cancellation: stdio_server teardown relies
+                # on it propagating so pending I/O is reclaimed promptly
+                raise
             except Exception as e:
-                logger.error(f"Error handling tool {name}: {str(e)}")
+                logger.error("Error handling tool %s: %s", name, e)
                 return [TextContent(type="text", text=f"Error: {str(e)}")]
     
     async def _handle_connect(self, args: Dict[str, Any]) -> List[TextContent]:
         """Handle Odoo connection"""
         try:
-            # Use provided args or fallback to environment variables
-            url = args.get("url") or os.getenv("ODOO_URL")
-            database = args.get("database") or os.getenv("ODOO_DATABASE")
-            username = args.get("username") or os.getenv("ODOO_USERNAME")
-            password = args.get("password") or os.getenv("ODOO_PASSWORD")
+            # Use provided args or fallback to environment defaults
+            url = args.get("url") or _DEFAULT_URL
+            database = args.get("database") or _DEFAULT_DATABASE
+            username = args.get("username") or _DEFAULT_USERNAME
+            password = args.get("password") or _DEFAULT_PASSWORD
             
             if not all([url, database, username, password]):
-                return [TextContent(type="text", text="Missing connection parameters. Provide url, database, username, password or set environment variables.")]
-            
-            self.odoo_client = OdooClient(
-                url=url,
-                database=database,
-                username=username,
-                password=password
-            )
-            await self.odoo_client.connect()
+                return _MISSING_PARAMS
             
+            # Reuse a previously authenticated client for the same target
+            # so repeated odoo_connect calls keep their session alive.
+            # A cached client is only reused when the supplied password
+            # still matches: after a rotation (or a wrong password) the
+            # old client is torn down and authentication runs again
+            # instead of silently answering with the stale session
+            key = (url, database, username)
+            client = self._client_cache.get(key)
+            if client is not None and (not client.uid or client.password != password):
+                del self._client_cache[key]
+                await client.close()
+                client = None
+            if client is None:
+                client = OdooClient(
+                    url=url,
+                    database=database,
+                    username=username,
+                    password=password
+                )
+                await client.connect()
+                self._client_cache[key] = client
+            self.odoo_client = client
+
             # Store connection params for reconnection
             self.connection_params = {
                 "url": url,
@@ -271,14 +393,12 @@ class OdooMCPServer:
             
             return [TextContent(type="text", text=f"Successfully connected to Odoo at {url} (database: {database})")]
         except Exception as e:
-            logger.error(f"Connection error: {str(e)}")
+            logger.error("Connection error: %s", e)
             return [TextContent(type="text", text=f"Connection failed: {str(e)}")]
     
+    @_requires_connection
     async def _handle_search(self, args: Dict[str, Any]) -> List[TextContent]:
         """Handle record search"""
-        if not self.odoo_client:
-            return [TextContent(type="text", text="Not connected to Odoo. Use odoo_connect first.")]
-        
         try:
             result = await self.odoo_client.search_read(
                 model=args["model"],
@@ -286,15 +406,13 @@ class OdooMCPServer:
                 fields=args.get("fields", []),
                 limit=args.get("limit", 100)
             )
-            return [TextContent(type="text", text=f"Found {len(result)} records: {result}")]
+            return [TextContent(type="text", text=f"Found {len(result)} records: {orjson.dumps(result).decode()}")]
         except Exception as e:
             return [TextContent(type="text", text=f"Search failed: {str(e)}")]
     
+    @_requires_connection
     async def _handle_create(self, args: Dict[str, Any]) -> List[TextContent]:
         """Handle record creation"""
-        if not self.odoo_client:
-            return [TextContent(type="text", text="Not connected to Odoo. Use odoo_connect first.")]
-        
         try:
             record_id = await self.odoo_client.create(
                 model=args["model"],
@@ -304,26 +422,67 @@ class OdooMCPServer:
         except Exception as e:
             return [TextContent(type="text", text=f"Create failed: {str(e)}")]
     
+    @_requires_connection
     async def _handle_write(self, args: Dict[str, Any]) -> List[TextContent]:
-        """Handle record update"""
-        if not self.odoo_client:
-            return [TextContent(type="text", text="Not connected to Odoo. Use odoo_connect first.")]
-        
+        """Handle record update
+
+        Writes are routed through the coalescing queue so compatible
+        updates arriving in the same burst share one RPC round trip.
+        """
         try:
-            result = await self.odoo_client.write(
-                model=args["model"],
-                ids=args["ids"],
-                values=args["values"]
-            )
+            result = await self._enqueue_write(args["model"], args["ids"], args["values"])
             return [TextContent(type="text", text=f"Updated {len(args['ids'])} records: {result}")]
         except Exception as e:
             return [TextContent(type="text", text=f"Update failed: {str(e)}")]
+
+    def _enqueue_write(self, model: str, ids: List[int], values: Dict) -> "asyncio.Future":
+        """Queue a write and (re)arm the debounced flush task"""
+        future = asyncio.get_running_loop().create_future()
+        self._write_queue.setdefault(model, []).append((ids, values, future))
+        if self._write_flush_task is None or self._write_flush_task.done():
+            self._write_flush_task = asyncio.create_task(self._flush_writes())
+        return future
+
+    async def _flush_writes(self):
+        """Flush queued writes, merging those with identical values
+
+        Writes against the same model with byte-identical values dicts
+        are issued as a single write over the combined id list; the rest
+        go out individually. All waiters get the result (or exception)
+        of the RPC that carried their ids.
+
+        Loops until the queue is empty: writes enqueued while a flush
+        is awaiting its RPCs land in a fresh queue with no new task
+        armed (_enqueue_write sees this one as still running), so the
+        running task must pick them up itself before finishing.
+        """
+        while self._write_queue:
+            await asyncio.sleep(_WRITE_COALESCE_WINDOW)
+            queue, self._write_queue = self._write_queue, {}
+            for model, entries in queue.items():
+                groups: Dict[bytes, List[tuple]] = {}
+                for ids, values, future in entries:
+                    key = orjson.dumps(values, option=orjson.OPT_SORT_KEYS)
+                    groups.setdefault(key, []).append((ids, values, future))
+                for grouped in groups.values():
+                    all_ids = sorted({i for ids, _, _ in grouped for i in ids})
+                    try:
+                        result = await self.odoo_client.write(
+                            model=model,
+                            ids=all_ids,
+                            values=grouped[0][1]
+                        )
+                        for _, _, future in grouped:
+                            if not future.done():
+                                future.set_result(result)
+                    except Exception as e:
+                        for _, _, future in grouped:
+                            if not future.done():
+                                future.set_exception(e)
     
+    @_requires_connection
     async def _handle_unlink(self, args: Dict[str, Any]) -> List[TextContent]:
         """Handle record deletion"""
-        if not self.odoo_client:
-            return [TextContent(type="text", text="Not connected to Odoo. Use odoo_connect first.")]
-        
         try:
             result = await self.odoo_client.unlink(
                 model=args["model"],
@@ -333,11 +492,9 @@ class OdooMCPServer:
         except Exception as e:
             return [TextContent(type="text", text=f"Delete failed: {str(e)}")]
     
+    @_requires_connection
     async def _handle_call(self, args: Dict[str, Any]) -> List[TextContent]:
         """Handle method call"""
-        if not self.odoo_client:
-            return [TextContent(type="text", text="Not connected to Odoo. Use odoo_connect first.")]
-        
         try:
             result = await self.odoo_client.call_method(
                 model=args["model"],
@@ -349,33 +506,27 @@ class OdooMCPServer:
         except Exception as e:
             return [TextContent(type="text", text=f"Method call failed: {str(e)}")]
     
+    @_requires_connection
     async def _handle_get_models(self, args: Dict[str, Any]) -> List[TextContent]:
         """Handle get models request"""
-        if not self.odoo_client:
-            return [TextContent(type="text", text="Not connected to Odoo. Use odoo_connect first.")]
-        
         try:
             models = await self.odoo_client.get_models(args.get("filter"))
-            return [TextContent(type="text", text=f"Available models: {json.dumps(models, indent=2)}")]
+            return [TextContent(type="text", text=f"Available models: {orjson.dumps(models).decode()}")]
         except Exception as e:
             return [TextContent(type="text", text=f"Get models failed: {str(e)}")]
     
+    @_requires_connection
     async def _handle_get_fields(self, args: Dict[str, Any]) -> List[TextContent]:
         """Handle get fields request"""
-        if not self.odoo_client:
-            return [TextContent(type="text", text="Not connected to Odoo. Use odoo_connect first.")]
-        
         try:
             fields = await self.odoo_client.get_fields(args["model"])
-            return [TextContent(type="text", text=f"Fields for {args['model']}: {json.dumps(fields, indent=2)}")]
+            return [TextContent(type="text", text=f"Fields for {args['model']}: {orjson.dumps(fields).decode()}")]
         except Exception as e:
             return [TextContent(type="text", text=f"Get fields failed: {str(e)}")]
     
+    @_requires_connection
     async def _handle_count(self, args: Dict[str, Any]) -> List[TextContent]:
         """Handle count records request"""
-        if not self.odoo_client:
-            return [TextContent(type="text", text="Not connected to Odoo. Use odoo_connect first.")]
-        
         try:
             count = await self.odoo_client.count(
                 model=args["model"],
@@ -385,91 +536,137 @@ class OdooMCPServer:
         except Exception as e:
             return [TextContent(type="text", text=f"Count failed: {str(e)}")]
 
-        async def _handle_update_lead_contact(self, args: Dict[str, Any]) -> List[TextContent]:
-            """Update CRM lead contact fields"""
-            if not self.odoo_client:
-                return [TextContent(type="text", text="Not connected to Odoo. Use odoo_connect first.")]
+    @_requires_connection
+    async def _handle_update_lead_contact(self, args: Dict[str, Any]) -> List[TextContent]:
+        """Update CRM lead contact fields"""
+        try:
+            lead_id = int(args["lead_id"])
+            values = args["values"]
+            result = await self.odoo_client.write(
+                model="crm.lead",
+                ids=[lead_id],
+                values=values
+            )
+            return [TextContent(type="text", text=f"Lead {lead_id} updated: {result}")]
+        except Exception as e:
+            return [TextContent(type="text", text=f"Update lead contact failed: {str(e)}")]
 
-            try:
-                lead_id = int(args["lead_id"])
-                values = args["values"]
-                result = await self.odoo_client.write(
-                    model="crm.lead",
-                    ids=[lead_id],
-                    values=values
-                )
-                return [TextContent(type="text", text=f"Lead {lead_id} updated: {result}")]
-            except Exception as e:
-                return [TextContent(type="text", text=f"Update lead contact failed: {str(e)}")]
+    @_requires_connection
+    async def _handle_update_contact(self, args: Dict[str, Any]) -> List[TextContent]:
+        """Update res.partner contact fields"""
+        try:
+            partner_id = int(args["partner_id"])
+            values = args["values"]
+            result = await self.odoo_client.write(
+                model="res.partner",
+                ids=[partner_id],
+                values=values
+            )
+            return [TextContent(type="text", text=f"Contact {partner_id} updated: {result}")]
+        except Exception as e:
+            return [TextContent(type="text", text=f"Update contact failed: {str(e)}")]
 
-        async def _handle_update_contact(self, args: Dict[str, Any]) -> List[TextContent]:
-            """Update res.partner contact fields"""
-            if not self.odoo_client:
-                return [TextContent(type="text", text="Not connected to Odoo. Use odoo_connect first.")]
+    @_requires_connection
+    async def _handle_read_group(self, args: Dict[str, Any]) -> List[TextContent]:
+        """Run read_group aggregation for reporting"""
+        try:
+            result = await self.odoo_client.read_group(
+                model=args["model"],
+                domain=args.get("domain", []),
+                fields=args.get("fields", []),
+                groupby=args.get("groupby", []),
+                limit=args.get("limit", 100),
+                orderby=args.get("orderby"),
+                lazy=args.get("lazy", True)
+            )
+            payload = orjson.dumps(result)
+            if len(payload) <= _MAX_TEXT_CHUNK:
+                return [TextContent(type="text", text=f"read_group result: {payload.decode()}")]
+            # Split oversized results into evenly sized group slices
+            step = max(1, len(result) * _MAX_TEXT_CHUNK // len(payload))
+            return [
+                TextContent(type="text", text=orjson.dumps(result[i:i + step]).decode())
+                for i in range(0, len(result), step)
+            ]
+        except Exception as e:
+            return [TextContent(type="text", text=f"read_group failed: {str(e)}")]
 
-            try:
-                partner_id = int(args["partner_id"])
-                values = args["values"]
-                result = await self.odoo_client.write(
-                    model="res.partner",
-                    ids=[partner_id],
-                    values=values
-                )
-                return [TextContent(type="text", text=f"Contact {partner_id} updated: {result}")]
-            except Exception as e:
-                return [TextContent(type="text", text=f"Update contact failed: {str(e)}")]
+    async def _handle_batch(self, args: Dict[str, Any]) -> List[TextContent]:
+        """Run independent tool calls concurrently and merge their replies
 
-        async def _handle_read_group(self, args: Dict[str, Any]) -> List[TextContent]:
-            """Run read_group aggregation for reporting"""
-            if not self.odoo_client:
-                return [TextContent(type="text", text="Not connected to Odoo. Use odoo_connect first.")]
+        Each sub-call is I/O-bound on an Odoo RPC, so running them under
+        gather collapses total latency from the sum of the calls to the
+        slowest one. Replies keep the order of the submitted calls.
+        """
+        calls = args.get("calls") or []
+        if not calls:
+            return [TextContent(type="text", text="No calls provided")]
 
-            try:
-                result = await self.odoo_client.read_group(
-                    model=args["model"],
-                    domain=args.get("domain", []),
-                    fields=args.get("fields", []),
-                    groupby=args.get("groupby", []),
-                    limit=args.get("limit", 100),
-                    orderby=args.get("orderby"),
-                    lazy=args.get("lazy", True)
-                )
-                return [TextContent(type="text", text=f"read_group result: {json.dumps(result, indent=2)}")]
-            except Exception as e:
-                return [TextContent(type="text", text=f"read_group failed: {str(e)}")]
+        async def _unknown(name: str) -> List[TextContent]:
+            return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
-        async def _handle_web_search(self, args: Dict[str, Any]) -> List[TextContent]:
-            """Search the web via Tavily API"""
-            try:
-                if TavilyClient is None:
-                    return [TextContent(type="text", text="Tavily client not available. Install tavily-python.")]
+        coros = []
+        for call in calls:
+            name = call.get("name", "")
+            handler = self._dispatch.get(name)
+            # Nested batches would deadlock nothing but add no value;
+            # treat them like an unknown tool
+            if handler is None or handler is self._handle_batch:
+                coros.append(_unknown(name))
+            else:
+                coros.append(handler(call.get("arguments") or {}))
 
-                api_key = os.getenv("TAVILY_API_KEY")
-                if not api_key:
-                    return [TextContent(type="text", text="Missing TAVILY_API_KEY in environment.")]
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        merged: List[TextContent] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                merged.append(TextContent(type="text", text=f"Error: {str(result)}"))
+            else:
+                merged.extend(result)
+        return merged
 
-                client = TavilyClient(api_key=api_key)
-                query = args["query"]
-                max_results = int(args.get("max_results", 5))
-                search_depth = args.get("search_depth", "basic")
+    async def _handle_web_search(self, args: Dict[str, Any]) -> List[TextContent]:
+        """Search the web via Tavily API"""
+        try:
+            global TavilyClient, _tavily_import_attempted
+            if not _tavily_import_attempted:
+                _tavily_import_attempted = True
+                try:
+                    from tavily import TavilyClient as _imported
+                    TavilyClient = _imported
+                except Exception:
+                    TavilyClient = None
+            if TavilyClient is None:
+                return [TextContent(type="text", text="Tavily client not available. Install tavily-python.")]
 
-                result = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: client.search(query=query, max_results=max_results, search_depth=search_depth)
-                )
+            api_key = _TAVILY_API_KEY
+            if not api_key:
+                return [TextContent(type="text", text="Missing TAVILY_API_KEY in environment.")]
 
-                # Normaliser en liste simple de {title, url, snippet}
-                items = []
-                for hit in result.get("results", []):
-                    items.append({
-                        "title": hit.get("title"),
-                        "url": hit.get("url"),
-                        "snippet": hit.get("content") or hit.get("snippet")
-                    })
+            if self._tavily_client is None:
+                self._tavily_client = TavilyClient(api_key=api_key)
+            client = self._tavily_client
+            query = args["query"]
+            max_results = int(args.get("max_results", 5))
+            search_depth = args.get("search_depth", "basic")
 
-                return [TextContent(type="text", text=json.dumps(items, indent=2))]
-            except Exception as e:
-                return [TextContent(type="text", text=f"web_search failed: {str(e)}")]
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._io_executor,
+                functools.partial(client.search, query=query, max_results=max_results, search_depth=search_depth)
+            )
+
+            # Normaliser en liste simple de {title, url, snippet}
+            items = []
+            for hit in result.get("results", []):
+                items.append({
+                    "title": hit.get("title"),
+                    "url": hit.get("url"),
+                    "snippet": hit.get("content") or hit.get("snippet")
+                })
+
+            return [TextContent(type="text", text=orjson.dumps(items).decode())]
+        except Exception as e:
+            return [TextContent(type="text", text=f"web_search failed: {str(e)}")]
 
 async def main():
     """Main entry point for the MCP server"""
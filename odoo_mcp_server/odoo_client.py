@@ -1,23 +1,165 @@
 import xmlrpc.client
 import asyncio
+import collections
+import concurrent.futures
+import http.client
+import itertools
+import os
+import socket
 import ssl
+import time
 from typing import Any, Dict, List, Optional
 import logging
 from urllib.parse import urlparse
 
+import orjson
+import requests
+
 logger = logging.getLogger(__name__)
 
+# Methods safe to replay after a transport failure: a dropped connection
+# leaves it unknown whether the server applied the call, so only
+# read-only methods are retried automatically
+_IDEMPOTENT_METHODS = frozenset({
+    'search', 'search_read', 'search_fetch', 'search_count',
+    'read', 'read_group', 'fields_get',
+})
+
+
+class KeepAliveTransport(xmlrpc.client.Transport):
+    """HTTP transport tuned for many small RPCs to one host
+
+    The stdlib transport already caches a single persistent connection
+    per host; connecting it eagerly and disabling Nagle keeps small
+    request/response payloads from waiting on delayed ACKs, and spares
+    every call after the first its TCP handshake.
+    """
+
+    def make_connection(self, host):
+        connection = super().make_connection(host)
+        if connection.sock is None:
+            connection.connect()
+        connection.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return connection
+
+
+class KeepAliveSafeTransport(xmlrpc.client.SafeTransport):
+    """HTTPS variant of :class:`KeepAliveTransport`
+
+    Reusing the cached connection also reuses its TLS session, so the
+    handshake cost is paid once per transport instead of once per call.
+    """
+
+    def make_connection(self, host):
+        connection = super().make_connection(host)
+        if connection.sock is None:
+            connection.connect()
+        connection.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return connection
+
+
+class _JsonRpcProxy:
+    """Minimal Odoo /jsonrpc caller mirroring the ServerProxy surface
+
+    JSON envelopes are several times smaller than the XML equivalent and
+    decode through orjson instead of expat, which pays off on large
+    search_read/fields_get responses. Calls are synchronous over a
+    keep-alive requests session and run on the client's RPC thread
+    pool, exactly like the XML-RPC proxies they stand in for.
+    """
+
+    def __init__(self, url: str, service: str):
+        self._url = f"{url}/jsonrpc"
+        self._service = service
+        self._session = requests.Session()
+        self._ids = itertools.count(1)
+
+    def _call(self, method: str, args: List) -> Any:
+        payload = orjson.dumps({
+            "jsonrpc": "2.0",
+            "method": "call",
+            "params": {"service": self._service, "method": method, "args": args},
+            "id": next(self._ids),
+        })
+        response = self._session.post(
+            self._url,
+            data=payload,
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        reply = orjson.loads(response.content)
+        if reply.get("error"):
+            raise Exception(f"JSON-RPC error: {reply['error']}")
+        return reply.get("result")
+
+    def authenticate(self, *args) -> Any:
+        return self._call("authenticate", list(args))
+
+    def execute_kw(self, *args) -> Any:
+        return self._call("execute_kw", list(args))
+
+    def close(self):
+        """Close the underlying keep-alive session"""
+        self._session.close()
+
+
 class OdooClient:
-    """Async Odoo XML-RPC client for MCP server"""
+    """Async Odoo client for MCP server
+
+    Speaks XML-RPC by default; set ODOO_MCP_PROTOCOL=jsonrpc to use
+    Odoo's /jsonrpc endpoint instead, which trades the XML envelope for
+    a smaller JSON one decoded with orjson.
+    """
     
-    def __init__(self, url: str, database: str, username: str, password: str):
+    def __init__(self, url: str, database: str, username: str, password: str = None, api_key: str = None,
+                 executor: concurrent.futures.Executor = None):
         self.url = url.rstrip('/')
         self.database = database
         self.username = username
         self.password = password
+        # Odoo accepts a per-user API key wherever a password goes; the
+        # secret actually shipped in every RPC envelope is resolved once
+        # here so callers can avoid re-sending their login password
+        self._secret = api_key or password
         self.uid = None
         self.common = None
         self.models = None
+        # (proxy, bound execute_kw) pairs rotated round-robin by _call so
+        # concurrent RPCs spread over several persistent connections
+        self._proxies: collections.deque = collections.deque()
+        self.ops: Dict[str, Any] = {}
+        # RPC threads spend their time blocked on the network, so the
+        # pool is sized for I/O fan-out rather than CPU count; asyncio's
+        # default executor caps at min(32, cpus + 4) and serializes
+        # bursts well below that. A caller-supplied executor (as used by
+        # OdooClientPool) is shared between clients and stays the
+        # caller's to shut down.
+        if executor is not None:
+            self._executor = executor
+            self._owns_executor = False
+        else:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=int(os.environ.get("ODOO_MCP_WORKERS", "64")),
+                thread_name_prefix="odoo-rpc"
+            )
+            self._owns_executor = True
+        # Model and field metadata is near-static per database, so it is
+        # cached in-process with a TTL instead of re-fetched every call
+        self._cache_ttl = float(os.environ.get("ODOO_MCP_CACHE_TTL", "3600"))
+        self._models_cache: Dict[Optional[str], tuple] = {}
+        self._fields_cache: Dict[str, tuple] = {}
+        # xmlrpc stays the default; jsonrpc can be rolled out gradually
+        self._protocol = os.environ.get("ODOO_MCP_PROTOCOL", "xmlrpc")
+        # Server capabilities probed on first use (None = unknown)
+        self._supports_multicall: Optional[bool] = None
+        self._supports_search_fetch: Optional[bool] = None
+        # Comma-separated models whose fields_get is prefetched on
+        # connect (e.g. "res.partner,sale.order"); empty disables warming
+        self._warm_models = [
+            m.strip()
+            for m in os.environ.get("ODOO_MCP_WARM_MODELS", "").split(",")
+            if m.strip()
+        ]
         self._setup_ssl_context()
     
     def _setup_ssl_context(self):
@@ -26,232 +168,261 @@ class OdooClient:
         # For development/testing, you might want to disable SSL verification
         # self.ssl_context.check_hostname = False
         # self.ssl_context.verify_mode = ssl.CERT_NONE
-    
+
+    def _make_transport(self) -> xmlrpc.client.Transport:
+        """Build a keep-alive transport matching the URL scheme
+
+        The stdlib transport already sends Accept-Encoding: gzip and
+        inflates compressed responses transparently, which matters for
+        multi-MB get_models/fields_get payloads; ODOO_MCP_GZIP=0 turns
+        the negotiation off for CPU-constrained deployments.
+        """
+        if urlparse(self.url).scheme == 'https':
+            transport = KeepAliveSafeTransport(context=self.ssl_context)
+        else:
+            transport = KeepAliveTransport()
+        transport.accept_gzip_encoding = os.environ.get("ODOO_MCP_GZIP", "1") != "0"
+        return transport
+
+    def _make_object_proxy(self):
+        """Build one proxy for the object endpoint"""
+        if self._protocol == "jsonrpc":
+            return _JsonRpcProxy(self.url, "object")
+        return xmlrpc.client.ServerProxy(
+            f'{self.url}/xmlrpc/2/object',
+            transport=self._make_transport(),
+            allow_none=True,
+            use_builtin_types=True
+        )
+
+    def _replace_proxy(self, entry):
+        """Swap a proxy whose connection broke for a freshly built one"""
+        try:
+            self._proxies.remove(entry)
+        except ValueError:
+            # Another task already replaced it
+            return
+        proxy = self._make_object_proxy()
+        self._proxies.append((proxy, proxy.execute_kw))
+
     async def connect(self):
         """Establish connection to Odoo server"""
         try:
-            # Setup XML-RPC connections
-            self.common = xmlrpc.client.ServerProxy(f'{self.url}/xmlrpc/2/common')
-            self.models = xmlrpc.client.ServerProxy(f'{self.url}/xmlrpc/2/object')
-            
+            if self._protocol == "jsonrpc":
+                self.common = _JsonRpcProxy(self.url, "common")
+                proxies = [_JsonRpcProxy(self.url, "object")]
+            else:
+                # Keep-alive transports, one per proxy, so each endpoint
+                # keeps its own persistent connection; the object
+                # endpoint gets a small pool of proxies so concurrent
+                # RPCs don't serialize on a single connection
+                self.common = xmlrpc.client.ServerProxy(
+                    f'{self.url}/xmlrpc/2/common',
+                    transport=self._make_transport(),
+                    allow_none=True,
+                    use_builtin_types=True
+                )
+                pool_size = int(os.environ.get("ODOO_MCP_PROXIES", "8"))
+                proxies = [self._make_object_proxy() for _ in range(pool_size)]
+
+            self.models = proxies[0]
+            # execute_kw is bound once per proxy; _call rotates over the
+            # pairs instead of re-walking the attribute chain per RPC
+            self._proxies = collections.deque(
+                (proxy, proxy.execute_kw) for proxy in proxies
+            )
+
             # Authenticate
-            self.uid = await asyncio.get_event_loop().run_in_executor(
-                None, 
+            self.uid = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
                 self.common.authenticate,
-                self.database, self.username, self.password, {}
+                self.database, self.username, self._secret, {}
             )
             
             if not self.uid:
                 raise Exception("Authentication failed")
-            
-            logger.info(f"Connected to Odoo as user ID: {self.uid}")
-            
+
+            # Bind the operation table once so per-call dispatch is a
+            # single dict lookup on already-bound methods instead of
+            # repeated attribute lookups on the client
+            self.ops = {
+                "search": self.search_read,
+                "create": self.create,
+                "write": self.write,
+                "unlink": self.unlink,
+                "call": self.call_method,
+                "models": self.get_models,
+                "fields": self.get_fields,
+                "count": self.count,
+                "read": self.read,
+            }
+
+            if self._warm_models:
+                # Best-effort: pre-populate the fields cache for the
+                # models UIs hit first; a warming failure must never
+                # fail the connect itself
+                await asyncio.gather(
+                    *(self.get_fields(model) for model in self._warm_models),
+                    return_exceptions=True
+                )
+
+            logger.info("Connected to Odoo as user ID: %s", self.uid)
+
         except Exception as e:
-            logger.error(f"Connection error: {str(e)}")
+            logger.error("Connection error: %s", e)
             raise
     
-    async def search_read(self, model: str, domain: List = None, fields: List = None, limit: int = 100) -> List[Dict]:
-        """Search and read records from Odoo model"""
+    async def _call(self, model: str, method: str, args: List, kwargs: Dict = None, op: str = "RPC") -> Any:
+        """Run one execute_kw on the RPC thread pool
+
+        Central choke point for every public method: the auth guard,
+        the executor hand-off on the pre-bound execute_kw and the error
+        logging all live here instead of being repeated per method.
+
+        Only read-only methods (see _IDEMPOTENT_METHODS) are retried on
+        transport failures: when a connection dies mid-call the server
+        may already have applied the request, so replaying a create,
+        write or unlink could execute it twice.
+        """
         if not self.uid:
             raise Exception("Not authenticated")
-        
-        domain = domain or []
-        fields = fields or []
-        
+
+        call_args = [self.database, self.uid, self._secret, model, method, args]
+        if kwargs is not None:
+            call_args.append(kwargs)
+
+        # One retry on a fresh connection covers transient transport
+        # failures (idle keep-alive connections dropped by proxies,
+        # connection resets) without hiding persistent outages
+        retriable = method in _IDEMPOTENT_METHODS
+        delays = (0.05, 0.2)
+        for attempt, delay in enumerate(delays):
+            entry = self._proxies[0]
+            self._proxies.rotate(-1)
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._executor, entry[1], *call_args
+                )
+            except (xmlrpc.client.ProtocolError, http.client.BadStatusLine, OSError) as e:
+                self._replace_proxy(entry)
+                if not retriable or attempt == len(delays) - 1:
+                    logger.error("%s error: %s", op, e)
+                    raise
+                logger.warning("%s transport error, retrying: %s", op, e)
+                await asyncio.sleep(delay)
+            except Exception as e:
+                logger.error("%s error: %s", op, e)
+                raise
+
+    async def search_read(self, model: str, domain: List = None, fields: List = None, limit: int = 100) -> List[Dict]:
+        """Search and read records from Odoo model"""
+        return await self._call(
+            model, 'search_read', [domain or []],
+            {'fields': fields or [], 'limit': limit},
+            op="Search read"
+        )
+
+    async def search_fetch(self, model: str, domain: List = None, fields: List = None, limit: int = 100) -> List[Dict]:
+        """Search and fetch records in one RPC (Odoo 17+)
+
+        search_fetch returns the records and warms the server-side ORM
+        cache in a single round trip, halving the cost of the common
+        search-then-read pipeline. Servers that predate it reject the
+        call (a Fault over xmlrpc, a plain error over jsonrpc); the
+        first rejection is memoized so later calls go straight to
+        search_read without a wasted probe or spurious error log.
+        """
+        if self._supports_search_fetch is False:
+            return await self.search_read(model, domain, fields, limit)
         try:
-            result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.models.execute_kw,
-                self.database, self.uid, self.password,
-                model, 'search_read',
-                [domain],
-                {'fields': fields, 'limit': limit}
+            result = await self._call(
+                model, 'search_fetch', [domain or [], fields or []],
+                {'limit': limit},
+                op="Search fetch"
             )
-            return result
-        except Exception as e:
-            logger.error(f"Search read error: {str(e)}")
+        except asyncio.CancelledError:
             raise
-    
+        except Exception:
+            # Server predates search_fetch (Odoo < 17)
+            self._supports_search_fetch = False
+            return await self.search_read(model, domain, fields, limit)
+        self._supports_search_fetch = True
+        return result
+
     async def create(self, model: str, values: Dict) -> int:
         """Create new record in Odoo model"""
-        if not self.uid:
-            raise Exception("Not authenticated")
-        
-        try:
-            record_id = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.models.execute_kw,
-                self.database, self.uid, self.password,
-                model, 'create',
-                [values]
-            )
-            return record_id
-        except Exception as e:
-            logger.error(f"Create error: {str(e)}")
-            raise
-    
+        return await self._call(model, 'create', [values], op="Create")
+
     async def write(self, model: str, ids: List[int], values: Dict) -> bool:
         """Update existing records in Odoo model"""
-        if not self.uid:
-            raise Exception("Not authenticated")
-        
-        try:
-            result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.models.execute_kw,
-                self.database, self.uid, self.password,
-                model, 'write',
-                [ids, values]
-            )
-            return result
-        except Exception as e:
-            logger.error(f"Write error: {str(e)}")
-            raise
-    
+        return await self._call(model, 'write', [ids, values], op="Write")
+
     async def unlink(self, model: str, ids: List[int]) -> bool:
         """Delete records from Odoo model"""
-        if not self.uid:
-            raise Exception("Not authenticated")
-        
-        try:
-            result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.models.execute_kw,
-                self.database, self.uid, self.password,
-                model, 'unlink',
-                [ids]
-            )
-            return result
-        except Exception as e:
-            logger.error(f"Unlink error: {str(e)}")
-            raise
-    
+        return await self._call(model, 'unlink', [ids], op="Unlink")
+
     async def call_method(self, model: str, method: str, args: List = None, kwargs: Dict = None) -> Any:
         """Call custom method on Odoo model"""
-        if not self.uid:
-            raise Exception("Not authenticated")
-        
-        args = args or []
-        kwargs = kwargs or {}
-        
-        try:
-            result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.models.execute_kw,
-                self.database, self.uid, self.password,
-                model, method,
-                args, kwargs
-            )
-            return result
-        except Exception as e:
-            logger.error(f"Method call error: {str(e)}")
-            raise
-    
+        return await self._call(model, method, args or [], kwargs or {}, op="Method call")
+
     async def search(self, model: str, domain: List = None, limit: int = 100) -> List[int]:
         """Search for record IDs in Odoo model"""
-        if not self.uid:
-            raise Exception("Not authenticated")
-        
-        domain = domain or []
-        
-        try:
-            result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.models.execute_kw,
-                self.database, self.uid, self.password,
-                model, 'search',
-                [domain],
-                {'limit': limit}
-            )
-            return result
-        except Exception as e:
-            logger.error(f"Search error: {str(e)}")
-            raise
-    
+        return await self._call(
+            model, 'search', [domain or []], {'limit': limit}, op="Search"
+        )
+
     async def read(self, model: str, ids: List[int], fields: List = None) -> List[Dict]:
         """Read specific records from Odoo model"""
-        if not self.uid:
-            raise Exception("Not authenticated")
-        
-        fields = fields or []
-        
-        try:
-            result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.models.execute_kw,
-                self.database, self.uid, self.password,
-                model, 'read',
-                [ids],
-                {'fields': fields}
-            )
-            return result
-        except Exception as e:
-            logger.error(f"Read error: {str(e)}")
-            raise
-    
+        return await self._call(
+            model, 'read', [ids], {'fields': fields or []}, op="Read"
+        )
+
     async def get_models(self, filter_pattern: str = None) -> List[Dict]:
-        """Get list of available Odoo models"""
-        if not self.uid:
-            raise Exception("Not authenticated")
-        
-        try:
-            # Get all models
-            models = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.models.execute_kw,
-                self.database, self.uid, self.password,
-                'ir.model', 'search_read',
-                [[]],
-                {'fields': ['model', 'name', 'info']}
-            )
-            
-            # Filter if pattern provided
-            if filter_pattern:
-                models = [m for m in models if filter_pattern.lower() in m['model'].lower()]
-            
-            return models
-        except Exception as e:
-            logger.error(f"Get models error: {str(e)}")
-            raise
-    
+        """Get list of available Odoo models
+
+        Filtering happens server-side with an ilike domain so only the
+        matching rows cross the wire; results are TTL-cached per
+        filter_pattern so repeat listings skip the RPC entirely.
+        """
+        key = filter_pattern.lower() if filter_pattern else None
+        cached = self._models_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+
+        domain = [('model', 'ilike', filter_pattern)] if filter_pattern else []
+        models = await self._call(
+            'ir.model', 'search_read', [domain],
+            {'fields': ['model', 'name', 'info']},
+            op="Get models"
+        )
+        self._models_cache[key] = (time.monotonic(), models)
+        return models
+
     async def get_fields(self, model: str) -> Dict:
-        """Get fields information for an Odoo model"""
-        if not self.uid:
-            raise Exception("Not authenticated")
-        
-        try:
-            fields = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.models.execute_kw,
-                self.database, self.uid, self.password,
-                model, 'fields_get',
-                [],
-                {}
-            )
-            return fields
-        except Exception as e:
-            logger.error(f"Get fields error: {str(e)}")
-            raise
-    
+        """Get fields information for an Odoo model (TTL-cached)"""
+        cached = self._fields_cache.get(model)
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+
+        fields = await self._call(model, 'fields_get', [], {}, op="Get fields")
+        self._fields_cache[model] = (time.monotonic(), fields)
+        return fields
+
+    def invalidate_cache(self, model: str = None):
+        """Drop cached metadata, for one model or everything
+
+        Call after schema changes (module installs, custom field edits)
+        so the next get_models/get_fields refetches from Odoo.
+        """
+        if model is None:
+            self._models_cache.clear()
+            self._fields_cache.clear()
+        else:
+            self._fields_cache.pop(model, None)
+
     async def count(self, model: str, domain: List = None) -> int:
         """Count records in Odoo model"""
-        if not self.uid:
-            raise Exception("Not authenticated")
-        
-        domain = domain or []
-        
-        try:
-            count = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.models.execute_kw,
-                self.database, self.uid, self.password,
-                model, 'search_count',
-                [domain]
-            )
-            return count
-        except Exception as e:
-            logger.error(f"Count error: {str(e)}")
-            raise
+        return await self._call(model, 'search_count', [domain or []], op="Count")
 
     async def read_group(
         self,
@@ -271,27 +442,259 @@ class OdooClient:
         - groupby: list of fields to group by (e.g. ["stage_id"]) 
         - limit/orderby/lazy: passthrough options
         """
+        # Direct construction instead of a filtering comprehension: lazy
+        # is a bool and never None, only limit/orderby are optional
+        kwargs = {'lazy': lazy}
+        if limit is not None:
+            kwargs['limit'] = limit
+        if orderby is not None:
+            kwargs['orderby'] = orderby
+
+        return await self._call(
+            model, 'read_group',
+            [domain or [], fields or [], groupby or []],
+            kwargs,
+            op="Read group"
+        )
+
+    async def _fanout(self, calls: List[tuple]) -> List[Any]:
+        """Run (model, method, args, kwargs) calls concurrently"""
+        return await asyncio.gather(
+            *(self.call_method(model, method, args, kwargs)
+              for model, method, args, kwargs in calls),
+            return_exceptions=True
+        )
+
+    async def multicall(self, calls: List[tuple]) -> List[Any]:
+        """Batch several execute_kw operations, one round trip when possible
+
+        Each call is a (model, method, args, kwargs) tuple; results come
+        back in call order, with the Fault object in place of the result
+        for sub-calls that failed (mirroring _fanout's per-call
+        exceptions). Where the server honors XML-RPC's system.multicall
+        the batch shares one HTTP request, but stock Odoo's
+        /xmlrpc/2/object dispatcher only accepts execute/execute_kw and
+        faults on it — that (and the jsonrpc protocol, where multicall
+        doesn't exist) degrades the batch to concurrent single calls on
+        the thread pool. The answer is remembered so only the first
+        batch pays the probe.
+        """
         if not self.uid:
             raise Exception("Not authenticated")
 
-        domain = domain or []
-        fields = fields or []
-        groupby = groupby or []
+        if self._protocol == "jsonrpc" or self._supports_multicall is False:
+            return await self._fanout(calls)
+
+        def _run():
+            mc = xmlrpc.client.MultiCall(self.models)
+            for model, method, args, kwargs in calls:
+                mc.execute_kw(
+                    self.database, self.uid, self._secret,
+                    model, method, args or [], kwargs or {}
+                )
+            # The RPC happens here: a Fault raised by mc() means the
+            # dispatcher rejected system.multicall itself, before any
+            # sub-call ran. Per-item faults surface lazily while the
+            # results are read out, *after* the server executed the
+            # batch, so they are collected in place rather than raised —
+            # re-dispatching at that point would re-run the sub-calls
+            # that already succeeded.
+            iterator = mc()
+            results: List[Any] = []
+            for index in range(len(calls)):
+                try:
+                    results.append(iterator[index])
+                except xmlrpc.client.Fault as fault:
+                    results.append(fault)
+            return results
 
         try:
-            result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.models.execute_kw,
-                self.database, self.uid, self.password,
-                model, 'read_group',
-                [domain, fields, groupby],
-                {k: v for k, v in {
-                    'limit': limit,
-                    'orderby': orderby,
-                    'lazy': lazy,
-                }.items() if v is not None}
+            results = await asyncio.get_running_loop().run_in_executor(
+                self._executor, _run
             )
-            return result
+            self._supports_multicall = True
+            return results
+        except xmlrpc.client.Fault:
+            # Server rejects system.multicall (the normal case on Odoo);
+            # nothing was executed, so the batch can safely be fanned out
+            self._supports_multicall = False
+            return await self._fanout(calls)
         except Exception as e:
-            logger.error(f"Read group error: {str(e)}")
-            raise
\ No newline at end of file
+            logger.error("Multicall error: %s", e)
+            raise
+
+    async def create_many(self, model: str, values_list: List[Dict]) -> List[int]:
+        """Create several records of one model in a single round trip"""
+        return await self.multicall(
+            [(model, 'create', [values], {}) for values in values_list]
+        )
+
+    async def write_many(self, model: str, updates: List[tuple]) -> List[bool]:
+        """Apply several (ids, values) updates in a single round trip"""
+        return await self.multicall(
+            [(model, 'write', [ids, values], {}) for ids, values in updates]
+        )
+
+    async def multi_search_read(self, requests: List[tuple]) -> List[Any]:
+        """Run several search_read calls concurrently
+
+        Each request is an argument tuple for :meth:`search_read`, e.g.
+        ``("res.partner", [("is_company", "=", True)], ["name"], 50)``.
+        Results (or the exception a call raised) come back in request
+        order; concurrency is bounded by the RPC thread pool, so N calls
+        cost roughly one round trip instead of N.
+        """
+        return await asyncio.gather(
+            *(self.search_read(*request) for request in requests),
+            return_exceptions=True
+        )
+
+    async def multi_count(self, requests: List[tuple]) -> List[Any]:
+        """Run several count calls concurrently; see multi_search_read"""
+        return await asyncio.gather(
+            *(self.count(*request) for request in requests),
+            return_exceptions=True
+        )
+
+    async def multi_get_fields(self, models: List[str]) -> List[Any]:
+        """Fetch fields_get for several models concurrently"""
+        return await asyncio.gather(
+            *(self.get_fields(model) for model in models),
+            return_exceptions=True
+        )
+
+    @staticmethod
+    def _close_proxy(proxy):
+        """Close a proxy's keep-alive connection, whatever its flavor"""
+        try:
+            if isinstance(proxy, _JsonRpcProxy):
+                proxy.close()
+            else:
+                # ServerProxy exposes close via the ("close") call form
+                proxy("close")()
+        except Exception:
+            pass
+
+    async def close(self):
+        """Tear down the client: RPC threads and keep-alive connections
+
+        The executor is released without waiting on in-flight calls
+        (unless it was supplied by the caller, who owns its lifetime);
+        the persistent sockets held by the common and object proxies
+        are closed so replaced clients don't leak connections.
+        """
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+        if self.common is not None:
+            self._close_proxy(self.common)
+        while self._proxies:
+            entry = self._proxies.pop()
+            self._close_proxy(entry[0])
+
+
+class OdooClientPool:
+    """Pool of pre-authenticated OdooClient instances
+
+    A single shared client serializes concurrent RPCs on one XML-RPC
+    session; the pool lets independent requests proceed in parallel over
+    separate connections. Acquire a client with::
+
+        async with pool.acquire() as client:
+            await client.search_read(...)
+    """
+
+    def __init__(self, url: str, database: str, username: str, password: str = None, api_key: str = None, size: int = 8):
+        self.url = url
+        self.database = database
+        self.username = username
+        self.password = password
+        self.api_key = api_key
+        self.size = size
+        self._queue: Optional[asyncio.Queue] = None
+        self._clients: List[OdooClient] = []
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    async def connect(self):
+        """Create and authenticate all pooled clients
+
+        The clients share one RPC executor owned by the pool — each
+        only needs enough threads for its own in-flight calls, and per-
+        client executors multiplied idle thread stacks by the pool size.
+        If any client fails to authenticate, the ones that did connect
+        are closed before the error propagates so a failed connect
+        attempt doesn't leak threads or sockets.
+        """
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=int(os.environ.get("ODOO_MCP_WORKERS", "64")),
+            thread_name_prefix="odoo-rpc"
+        )
+        clients = [
+            OdooClient(
+                url=self.url,
+                database=self.database,
+                username=self.username,
+                password=self.password,
+                api_key=self.api_key,
+                executor=self._executor
+            )
+            for _ in range(self.size)
+        ]
+        results = await asyncio.gather(
+            *(client.connect() for client in clients),
+            return_exceptions=True
+        )
+        failures = [r for r in results if isinstance(r, BaseException)]
+        if failures:
+            await asyncio.gather(
+                *(client.close() for client in clients),
+                return_exceptions=True
+            )
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            raise failures[0]
+
+        self._clients = clients
+        self._queue = asyncio.Queue()
+        for client in clients:
+            self._queue.put_nowait(client)
+
+        logger.info("Odoo client pool ready with %s connections", self.size)
+
+    def acquire(self) -> "_PooledClient":
+        """Borrow a client from the pool (async context manager)"""
+        if self._queue is None:
+            raise Exception("Pool not connected")
+        return _PooledClient(self._queue)
+
+    async def close(self):
+        """Close every pooled client, releasing threads and sockets
+
+        Called when the pool is replaced (e.g. a /connect with new
+        credentials) so the superseded clients don't leak their RPC
+        executors and keep-alive connections.
+        """
+        clients, self._clients = self._clients, []
+        self._queue = None
+        await asyncio.gather(
+            *(client.close() for client in clients),
+            return_exceptions=True
+        )
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+class _PooledClient:
+    """Async context manager returning a client to the pool on exit"""
+
+    def __init__(self, queue: asyncio.Queue):
+        self._queue = queue
+        self._client: Optional[OdooClient] = None
+
+    async def __aenter__(self) -> OdooClient:
+        self._client = await self._queue.get()
+        return self._client
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._queue.put_nowait(self._client)
+        return False
\ No newline at end of file
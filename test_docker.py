@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Docker smoke test for the Odoo MCP server image
+
+Builds the image, starts a test container and checks it stays healthy.
+The build → run → health chain is strictly ordered, but the
+docker-compose config check is independent, so it runs concurrently
+with the health check's startup wait instead of adding its own wall
+time.
+
+Daemon operations go through the docker SDK when it is installed
+(pip install docker), talking to the socket directly instead of
+forking the docker CLI for every step; without the SDK the script
+falls back to shelling out. docker-compose config has no SDK
+equivalent and always uses the CLI.
+
+Usage: python test_docker.py
+"""
+import asyncio
+import sys
+
+try:
+    import docker
+except ImportError:
+    docker = None
+
+IMAGE = "odoo-mcp-test"
+CONTAINER = "odoo-mcp-test"
+
+_ENVIRONMENT = {
+    "ODOO_URL": "https://demo.odoo.com",
+    "ODOO_DATABASE": "demo",
+    "ODOO_USERNAME": "admin",
+    "ODOO_PASSWORD": "admin",
+}
+
+_sdk_client = None
+
+
+def _docker_client():
+    """Return a shared docker SDK client, or None to use the CLI"""
+    global _sdk_client
+    if docker is None:
+        return None
+    if _sdk_client is None:
+        try:
+            _sdk_client = docker.from_env()
+        except Exception:
+            return None
+    return _sdk_client
+
+
+async def _offload(fn):
+    """Run a blocking SDK call without stalling the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(None, fn)
+
+
+async def run_command(command: str, timeout: float = 600) -> tuple:
+    """Run a shell command without blocking the event loop"""
+    process = await asyncio.create_subprocess_shell(
+        command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        return 1, "timed out"
+    return process.returncode, stdout.decode()
+
+
+async def _remove_container():
+    """Remove any leftover test container, SDK first, CLI as fallback"""
+    client = _docker_client()
+    if client is not None:
+        def remove():
+            try:
+                client.containers.get(CONTAINER).remove(force=True)
+            except Exception:
+                pass
+        await _offload(remove)
+    else:
+        await run_command(f"docker rm -f {CONTAINER}", timeout=60)
+
+
+async def test_docker_build() -> bool:
+    """Build the image from the local Dockerfile"""
+    client = _docker_client()
+    if client is not None:
+        try:
+            await _offload(lambda: client.images.build(path=".", tag=IMAGE))
+            ok, output = True, ""
+        except Exception as e:
+            ok, output = False, str(e)
+    else:
+        code, output = await run_command(f"docker build -t {IMAGE} .")
+        ok = code == 0
+    print(f"{'✅' if ok else '❌'} Docker Build")
+    if not ok:
+        print(output[-2000:])
+    return ok
+
+
+async def test_docker_run() -> bool:
+    """Start a detached test container"""
+    await _remove_container()
+    client = _docker_client()
+    if client is not None:
+        try:
+            await _offload(lambda: client.containers.run(
+                IMAGE,
+                name=CONTAINER,
+                detach=True,
+                ports={"8000/tcp": 8001},
+                environment=_ENVIRONMENT,
+            ))
+            ok, output = True, ""
+        except Exception as e:
+            ok, output = False, str(e)
+    else:
+        environment = " ".join(f"-e {k}={v}" for k, v in _ENVIRONMENT.items())
+        code, output = await run_command(
+            f"docker run -d --name {CONTAINER} -p 8001:8000 {environment} {IMAGE}"
+        )
+        ok = code == 0
+    print(f"{'✅' if ok else '❌'} Docker Run")
+    if not ok:
+        print(output)
+    return ok
+
+
+async def test_container_health() -> bool:
+    """Give the container time to start, then check it imports the package"""
+    # await instead of time.sleep so independent checks run meanwhile
+    await asyncio.sleep(10)
+
+    client = _docker_client()
+    if client is not None:
+        running = await _offload(
+            lambda: client.containers.list(filters={"name": CONTAINER})
+        )
+        if not running:
+            print("❌ Container Health: container not running")
+            return False
+        code, output = await _offload(
+            lambda: running[0].exec_run(
+                "python -c \"import odoo_mcp_server; print('OK')\""
+            )
+        )
+        ok = code == 0 and b"OK" in output
+    else:
+        code, output = await run_command(
+            f"docker ps --filter name={CONTAINER} --format '{{{{.Names}}}}'", timeout=60
+        )
+        if code != 0 or CONTAINER not in output:
+            print("❌ Container Health: container not running")
+            return False
+        code, output = await run_command(
+            f"docker exec {CONTAINER} python -c \"import odoo_mcp_server; print('OK')\"",
+            timeout=60,
+        )
+        ok = code == 0 and "OK" in output
+    print(f"{'✅' if ok else '❌'} Container Health")
+    return ok
+
+
+async def test_docker_compose() -> bool:
+    """Validate the compose file (CLI only: no SDK equivalent)"""
+    code, _ = await run_command("docker-compose config", timeout=60)
+    ok = code == 0
+    print(f"{'✅' if ok else '❌'} Docker Compose")
+    return ok
+
+
+async def main() -> int:
+    print("Testing Docker setup for odoo-mcp-server\n")
+    results = []
+
+    # Health depends on run, run depends on build: keep the chain serial
+    if await test_docker_build():
+        results.append(True)
+        if await test_docker_run():
+            results.append(True)
+            # The compose check is independent of the running container,
+            # so it overlaps the health check's 10 s startup wait
+            results.extend(await asyncio.gather(
+                test_container_health(),
+                test_docker_compose(),
+            ))
+        else:
+            results.append(False)
+    else:
+        results.append(False)
+
+    await _remove_container()
+
+    passed = sum(results)
+    print(f"\n{passed}/{len(results)} tests passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Smoke test for the Odoo MCP HTTP API
+
+Probes a running server (python -m odoo_mcp_server.http_server). Only
+/connect has an ordering dependency, so the read-only checks run
+concurrently over one keep-alive connection: total wall time is the
+connect chain plus the slowest single probe instead of the sum of all
+round trips.
+
+Usage: python test_http_api.py [base_url]
+"""
+import asyncio
+import os
+import sys
+
+import httpx
+
+BASE_URL = sys.argv[1] if len(sys.argv) > 1 else os.environ.get("MCP_API_URL", "http://localhost:8000")
+
+# Credentials from the test's environment; keys left unset fall back to
+# the server's own ODOO_* defaults in the /connect handler
+CONNECT_PAYLOAD = {
+    key: value
+    for key, value in {
+        "url": os.environ.get("ODOO_URL"),
+        "database": os.environ.get("ODOO_DATABASE"),
+        "username": os.environ.get("ODOO_USERNAME"),
+        "password": os.environ.get("ODOO_PASSWORD"),
+    }.items()
+    if value
+}
+
+
+async def test_health(client: httpx.AsyncClient) -> bool:
+    """Check the /health monitoring endpoint"""
+    response = await client.get("/health")
+    ok = response.status_code == 200 and response.json().get("status") == "healthy"
+    print(f"{'✅' if ok else '❌'} Health: {response.status_code}")
+    return ok
+
+
+async def test_root(client: httpx.AsyncClient) -> bool:
+    """Check the root service descriptor"""
+    response = await client.get("/")
+    ok = response.status_code == 200 and response.json().get("status") == "ok"
+    print(f"{'✅' if ok else '❌'} Root: {response.status_code}")
+    return ok
+
+
+async def test_connect(client: httpx.AsyncClient) -> bool:
+    """Connect with env credentials, falling back to server defaults"""
+    response = await client.post("/connect", json=CONNECT_PAYLOAD)
+    ok = response.status_code == 200
+    detail = response.json().get("message" if ok else "detail")
+    print(f"{'✅' if ok else '❌'} Connect: {response.status_code} - {detail}")
+    return ok
+
+
+async def test_search(client: httpx.AsyncClient) -> bool:
+    """Search a handful of partners"""
+    response = await client.post("/search", json={"model": "res.partner", "limit": 5})
+    ok = response.status_code == 200
+    count = response.json().get("count") if ok else response.text
+    print(f"{'✅' if ok else '❌'} Search: {response.status_code} - {count}")
+    return ok
+
+
+async def test_count(client: httpx.AsyncClient) -> bool:
+    """Count partners"""
+    response = await client.post("/count", json={"model": "res.partner", "domain": []})
+    ok = response.status_code == 200
+    count = response.json().get("count") if ok else response.text
+    print(f"{'✅' if ok else '❌'} Count: {response.status_code} - {count}")
+    return ok
+
+
+async def test_models(client: httpx.AsyncClient) -> bool:
+    """List models matching a filter"""
+    response = await client.post("/models", json={"filter": "res"})
+    ok = response.status_code == 200
+    count = response.json().get("count") if ok else response.text
+    print(f"{'✅' if ok else '❌'} Models: {response.status_code} - {count}")
+    return ok
+
+
+async def test_fields(client: httpx.AsyncClient) -> bool:
+    """Fetch field definitions for res.partner"""
+    response = await client.post("/fields", json={"model": "res.partner"})
+    ok = response.status_code == 200
+    print(f"{'✅' if ok else '❌'} Fields: {response.status_code}")
+    return ok
+
+
+async def main() -> int:
+    print(f"Testing Odoo MCP HTTP API at {BASE_URL}\n")
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
+        results = [await test_health(client), await test_root(client)]
+
+        # The read endpoints need an authenticated pool, so connect
+        # stays serial; everything after it is independent
+        connected = await test_connect(client)
+        results.append(connected)
+
+        if connected:
+            results.extend(await asyncio.gather(
+                test_search(client),
+                test_count(client),
+                test_models(client),
+                test_fields(client),
+            ))
+        else:
+            print("⚠️  Skipping data endpoints: connect failed")
+
+    passed = sum(results)
+    print(f"\n{passed}/{len(results)} tests passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))